@@ -5,58 +5,154 @@ Demonstrates how to add REST API functionality with template support
 
 import asyncio
 import json
-import time
+import logging
+import logging.handlers
+import queue
+import socket
 from typing import Dict, Optional
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 import threading
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import parse_qsl
+
+# Pick the fastest installed JSON codec: msgspec > orjson > stdlib json.
+# Requests and responses stay plain dicts so every backend can handle them.
+try:
+    from msgspec import json as _msgspec_json
+
+    def _json_dumps(data: Dict, indent: bool = False) -> bytes:
+        body = _msgspec_json.encode(data)
+        return _msgspec_json.format(body, indent=2) if indent else body
+
+    _json_loads = _msgspec_json.decode
+except ImportError:
+    try:
+        from orjson import dumps as _orjson_dumps, loads as _json_loads, OPT_INDENT_2
+
+        def _json_dumps(data: Dict, indent: bool = False) -> bytes:
+            return _orjson_dumps(data, option=OPT_INDENT_2 if indent else 0)
+
+    except ImportError:
+        # Fall back to stdlib json when neither is installed
+        def _json_loads(data):
+            if isinstance(data, memoryview):
+                data = data.tobytes()
+            return json.loads(data)
+
+        def _json_dumps(data: Dict, indent: bool = False) -> bytes:
+            return json.dumps(data, indent=2 if indent else None).encode("utf-8")
+
 
 from .main_server import MainServer
 from .template_renderer import get_template_renderer
 
+# Player names (uppercased) that mean "broadcast to everyone"
+_BROADCAST_ALIASES = frozenset({"ALL", "*", "EVERYONE", "BROADCAST"})
+
+# Hot-path logger; messages are %-formatted lazily and handed to a queue
+# so the /bc handler never blocks on a stdout write
+_api_logger = logging.getLogger("busapi")
+
+# CORS headers sent with every JSON response, encoded once
+_CORS_HEADERS = (
+    b"Access-Control-Allow-Origin: *\r\n"
+    b"Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n"
+    b"Access-Control-Allow-Headers: Content-Type\r\n"
+)
+
 
 class BusAPIHandler(BaseHTTPRequestHandler):
     """HTTP request handler for bus server endpoints with template support."""
 
-    def __init__(self, bus_server: MainServer, *args, **kwargs):
+    # Keep connections alive between requests so polled dashboards don't
+    # pay a TCP handshake per poll (responses always carry Content-Length)
+    protocol_version = "HTTP/1.1"
+
+    # Route dispatch tables: one dict lookup per request instead of walking
+    # an if/elif chain of string comparisons. All routes are exact paths;
+    # if parameterized routes (e.g. /api/client/{id}) are ever added, match
+    # them with a single compiled alternation regex on dict-lookup miss
+    # rather than reintroducing per-route startswith/split scans.
+    _GET_ROUTES = {
+        # Template routes
+        "/": "_handle_status_page",
+        "/status": "_handle_status_page",
+        "/api_docs": "_handle_api_docs_page",
+        "/docs": "_handle_api_docs_page",
+        "/broadcast": "_handle_broadcast_page",
+        "/admin": "_handle_admin_page",
+        # API routes
+        "/api/status": "_handle_status",
+        "/bc": "_handle_broadcast_get",
+    }
+
+    _POST_ROUTES = {
+        "/api/broadcast": "_handle_broadcast",
+        "/api/message": "_handle_message",
+    }
+
+    # Preformatted response headers, completed with Content-Length via
+    # bytes-%% and written together with the body in one wfile.write.
+    # This skips the per-header formatting/encoding that send_response/
+    # send_header redo on every response.
+    _JSON_HEADER = (
+        b"HTTP/1.1 200 OK\r\n"
+        b"Content-Type: application/json\r\n" + _CORS_HEADERS + b"Content-Length: %d\r\n"
+        b"\r\n"
+    )
+
+    _HTML_HEADER = (
+        b"HTTP/1.1 200 OK\r\n"
+        b"Content-Type: text/html; charset=utf-8\r\n"
+        b"Content-Length: %d\r\n"
+        b"\r\n"
+    )
+
+    _ERROR_HEADER = (
+        b"HTTP/1.1 %d %s\r\n"
+        b"Content-Type: application/json\r\n" + _CORS_HEADERS + b"Content-Length: %d\r\n"
+        b"\r\n"
+    )
+
+    def __init__(self, bus_server: MainServer, template_renderer, *args, **kwargs):
         self.bus_server = bus_server
-        self.template_renderer = get_template_renderer()
+        self.template_renderer = template_renderer
         super().__init__(*args, **kwargs)
 
     def do_GET(self):
         """Handle GET requests."""
-        parsed_path = urlparse(self.path)
-        path = parsed_path.path
-        query_params = parse_qs(parsed_path.query)
+        # Split off the query string by hand; urlparse allocates a full
+        # ParseResult even for the query-less dashboard routes
+        raw_path = self.path
+        query_start = raw_path.find("?")
+        path = raw_path if query_start < 0 else raw_path[:query_start]
+
+        handler_name = self._GET_ROUTES.get(path)
+        if handler_name is None:
+            self._send_error(404, "Not Found")
+            return
 
-        # Template routes
-        if path == "/" or path == "/status":
-            self._handle_status_page()
-        elif path == "/api_docs" or path == "/docs":
-            self._handle_api_docs_page()
-        elif path == "/broadcast":
-            self._handle_broadcast_page()
-        elif path == "/admin":
-            self._handle_admin_page()
-        # API routes
-        elif path == "/api/status":
-            self._handle_status()
-        elif path == "/bc":
-            self._handle_broadcast_get(query_params)
+        handler = getattr(self, handler_name)
+        if path == "/bc":
+            # Flat str->str dict in one pass; the general-purpose parse_qs
+            # wraps every value in a list we would immediately unwrap
+            query_params: Dict[str, str] = {}
+            if query_start >= 0:
+                for key, value in parse_qsl(raw_path[query_start + 1 :]):
+                    query_params.setdefault(key, value)
+            handler(query_params)
         else:
-            self._send_error(404, "Not Found")
+            handler()
 
     def do_POST(self):
         """Handle POST requests."""
-        parsed_path = urlparse(self.path)
-        path = parsed_path.path
+        path = self.path.partition("?")[0]
 
-        if path == "/api/broadcast":
-            self._handle_broadcast()
-        elif path == "/api/message":
-            self._handle_message()
-        else:
+        handler_name = self._POST_ROUTES.get(path)
+        if handler_name is None:
             self._send_error(404, "Not Found")
+            return
+
+        getattr(self, handler_name)()
 
     def _handle_status(self):
         """Return server status."""
@@ -76,23 +172,12 @@ class BusAPIHandler(BaseHTTPRequestHandler):
 
         try:
             # Get uptime
-            uptime = None
-            if hasattr(self.bus_server, "_event_loop") and hasattr(
-                self.template_renderer, "start_time"
-            ):
-                uptime_seconds = int(time.time() - self.template_renderer.start_time)
-                uptime = self.template_renderer._format_uptime(uptime_seconds)
-
-            # Get client information
-            clients = []
-            for client in self.bus_server.clients.values():
-                clients.append(
-                    {
-                        "client_id": client.client_id,
-                        "name": client.name,
-                        "state": client.state,
-                    }
-                )
+            uptime = self.template_renderer.get_uptime_str()
+
+            # Snapshot of connected clients; the template reads .client_id,
+            # .name and .state off the objects directly, so there's no need
+            # to copy each one into a dict
+            clients = tuple(self.bus_server.clients.values())
 
             # Get API port
             api_port = getattr(self.bus_server, "api_port", "N/A")
@@ -121,7 +206,11 @@ class BusAPIHandler(BaseHTTPRequestHandler):
             return
 
         try:
-            html_content = self.template_renderer.render_template("api_docs.html")
+            # The docs page has no per-request context, so the cached
+            # encoded render is served straight to the socket
+            html_content = self.template_renderer.render_template_bytes(
+                "api_docs.html"
+            )
             self._send_html_response(html_content)
         except Exception as e:
             self._send_error(500, f"Template rendering failed: {str(e)}")
@@ -159,10 +248,7 @@ class BusAPIHandler(BaseHTTPRequestHandler):
             api_port = getattr(self.bus_server, "api_port", "N/A")
 
             # Get uptime
-            uptime = None
-            if hasattr(self.template_renderer, "start_time"):
-                uptime_seconds = int(time.time() - self.template_renderer.start_time)
-                uptime = self.template_renderer._format_uptime(uptime_seconds)
+            uptime = self.template_renderer.get_uptime_str()
 
             context = {
                 "server_host": self.bus_server.host,
@@ -182,12 +268,29 @@ class BusAPIHandler(BaseHTTPRequestHandler):
         except Exception as e:
             self._send_error(500, f"Template rendering failed: {str(e)}")
 
-    def _handle_broadcast_get(self, query_params: Dict):
+    def _schedule_broadcast(self, message_id: str, args: Dict) -> bool:
+        """Fire-and-forget a broadcast on the bus server's event loop.
+
+        Returns False if the loop isn't available yet (server still
+        starting). call_soon_threadsafe + create_task is cheaper than
+        run_coroutine_threadsafe because no result Future is allocated;
+        broadcast() logs its own per-client failures.
+        """
+        loop = self.bus_server._event_loop
+        if loop is None:
+            return False
+
+        loop.call_soon_threadsafe(
+            asyncio.create_task, self.bus_server.broadcast(message_id, args)
+        )
+        return True
+
+    def _handle_broadcast_get(self, query_params: Dict[str, str]):
         """Handle broadcast message via GET request with query parameters."""
         try:
             # Extract parameters from query
-            player = query_params.get("player", [""])[0]
-            comm = query_params.get("comm", [""])[0]
+            player = query_params.get("player", "")
+            comm = query_params.get("comm", "")
 
             if not player or not comm:
                 self._send_error(400, "Missing required parameters: player and comm")
@@ -195,62 +298,40 @@ class BusAPIHandler(BaseHTTPRequestHandler):
 
             # Build message arguments - keep OpenKore format
             # Normalize "all" for OpenKore compatibility
-            target_player = player
-            if player.upper() in ["ALL", "*", "EVERYONE", "BROADCAST"]:
-                target_player = "all"  # OpenKore expects lowercase "all"
+            is_broadcast = player.upper() in _BROADCAST_ALIASES
+            # OpenKore expects lowercase "all"
+            target_player = "all" if is_broadcast else player
 
             args = {"player": target_player, "comm": comm}
 
             # Add any additional query parameters
-            for key, values in query_params.items():
-                if key not in ["player", "comm", "type"] and values:
-                    args[key] = values[0]
+            for key, value in query_params.items():
+                if key not in ("player", "comm", "type"):
+                    args[key] = value
 
             message_id = "busComm"  # Use OpenKore standard message ID
 
             # Log the API call
-            if not self.bus_server.quiet:
-                print(
-                    f"🌐 API Request: player='{player}', target_player='{target_player}', comm='{comm}', message_id='{message_id}'"
-                )
-                print(f"📤 Sending args: {args}")
+            _api_logger.info(
+                "API request: player='%s', target_player='%s', comm='%s', message_id='%s'",
+                player,
+                target_player,
+                comm,
+                message_id,
+            )
 
-            # Schedule the message send in the event loop
             try:
-                # Get the event loop from the main thread
-                if (
-                    hasattr(self.bus_server, "_event_loop")
-                    and self.bus_server._event_loop
-                ):
-                    loop = self.bus_server._event_loop
-                else:
-                    # Fallback: try to get the running loop
-                    try:
-                        loop = asyncio.get_running_loop()
-                    except RuntimeError:
-                        # Create a new event loop if none exists
-                        print(
-                            "⚠️ No running event loop found, creating a new one for message"
-                        )
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-
                 # Always broadcast the message - let clients decide if they should execute it
-                # This matches OpenKore's bus behavior where all messages are broadcast
-                future = asyncio.run_coroutine_threadsafe(
-                    self.bus_server.broadcast(message_id, args), loop
-                )
-                future.result(timeout=2.0)  # Wait up to 2 seconds
-
-                client_count = len(
-                    [
-                        c
-                        for c in self.bus_server.clients.values()
-                        if c.state == self.bus_server.IDENTIFIED
-                    ]
-                )
-
-                if player.upper() in ["ALL", "*", "EVERYONE", "BROADCAST"]:
+                # This matches OpenKore's bus behavior where all messages are broadcast.
+                # Don't block on the result: broadcast() logs its own send
+                # failures, so waiting here only serialized /bc throughput.
+                if not self._schedule_broadcast(message_id, args):
+                    self._send_error(500, "Server not ready")
+                    return
+
+                client_count = self.bus_server.identified_count
+
+                if is_broadcast:
                     response = {
                         "status": "success",
                         "message": "Message broadcasted to all clients",
@@ -260,8 +341,7 @@ class BusAPIHandler(BaseHTTPRequestHandler):
                         "target": "broadcast",
                     }
 
-                    if not self.bus_server.quiet:
-                        print(f"📡 API broadcast sent to {client_count} clients")
+                    _api_logger.info("API broadcast sent to %d clients", client_count)
                 else:
                     response = {
                         "status": "success",
@@ -272,35 +352,54 @@ class BusAPIHandler(BaseHTTPRequestHandler):
                         "target": target_player,
                     }
 
-                    if not self.bus_server.quiet:
-                        print(
-                            f"📨 API message for '{target_player}' broadcasted to {client_count} clients"
-                        )
+                    _api_logger.info(
+                        "API message for '%s' broadcasted to %d clients",
+                        target_player,
+                        client_count,
+                    )
 
                 self._send_json_response(response)
 
-            except asyncio.TimeoutError:
-                self._send_error(500, "Broadcast timeout")
             except Exception as e:
                 self._send_error(500, f"Broadcast failed: {str(e)}")
 
         except Exception as e:
             self._send_error(400, f"Bad Request: {str(e)}")
 
+    # Reusable POST body buffers, one per server thread
+    _post_buffers = threading.local()
+
+    def _read_post_body(self) -> memoryview:
+        """Read the POST body into a reusable per-thread buffer."""
+        content_length = int(self.headers["Content-Length"])
+        buffer = getattr(self._post_buffers, "buffer", None)
+        if buffer is None or len(buffer) < content_length:
+            buffer = self._post_buffers.buffer = bytearray(max(content_length, 8192))
+
+        view = memoryview(buffer)[:content_length]
+        read = 0
+        while read < content_length:
+            count = self.rfile.readinto(view[read:])
+            if not count:
+                break
+            read += count
+        return view[:read]
+
     def _handle_broadcast(self):
         """Handle broadcast message via API."""
         try:
-            content_length = int(self.headers["Content-Length"])
-            post_data = self.rfile.read(content_length)
-            data = json.loads(post_data.decode("utf-8"))
+            data = _json_loads(self._read_post_body())
 
             message_id = data.get("message_id", "API_BROADCAST")
             args = data.get("args", {})
 
-            # Schedule the broadcast in the event loop
-            asyncio.run_coroutine_threadsafe(
-                self.bus_server.broadcast(message_id, args), asyncio.get_event_loop()
-            )
+            # Schedule the broadcast on the bus loop. The old
+            # asyncio.get_event_loop() call raised in this worker thread
+            # (or, on older Pythons, scheduled onto a loop nothing runs),
+            # so POST broadcasts never actually went out.
+            if not self._schedule_broadcast(message_id, args):
+                self._send_error(500, "Server not ready")
+                return
 
             self._send_json_response({"status": "sent", "message_id": message_id})
 
@@ -310,9 +409,7 @@ class BusAPIHandler(BaseHTTPRequestHandler):
     def _handle_message(self):
         """Handle private message via API."""
         try:
-            content_length = int(self.headers["Content-Length"])
-            post_data = self.rfile.read(content_length)
-            data = json.loads(post_data.decode("utf-8"))
+            data = _json_loads(self._read_post_body())
 
             client_id = data.get("client_id")
             message_id = data.get("message_id", "API_MESSAGE")
@@ -322,14 +419,14 @@ class BusAPIHandler(BaseHTTPRequestHandler):
                 self._send_error(400, "client_id required")
                 return
 
+            loop = self.bus_server._event_loop
+            if loop is None:
+                self._send_error(500, "Server not ready")
+                return
+
             # Schedule the message send in the event loop
             future = asyncio.run_coroutine_threadsafe(
-                self.bus_server.send_to_client(client_id, message_id, args),
-                (
-                    self.bus_server._event_loop
-                    if hasattr(self.bus_server, "_event_loop")
-                    else asyncio.get_event_loop()
-                ),
+                self.bus_server.send_to_client(client_id, message_id, args), loop
             )
 
             success = future.result(timeout=1.0)
@@ -344,37 +441,43 @@ class BusAPIHandler(BaseHTTPRequestHandler):
 
     def _send_json_response(self, data: Dict):
         """Send JSON response."""
-        response = json.dumps(data, indent=2).encode("utf-8")
-        self.send_response(200)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Content-Length", str(len(response)))
-        self.send_header("Access-Control-Allow-Origin", "*")
-        self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
-        self.send_header("Access-Control-Allow-Headers", "Content-Type")
-        self.end_headers()
-        self.wfile.write(response)
-
-    def _send_html_response(self, html_content: str):
-        """Send HTML response."""
-        response = html_content.encode("utf-8")
-        self.send_response(200)
-        self.send_header("Content-Type", "text/html; charset=utf-8")
-        self.send_header("Content-Length", str(len(response)))
-        self.end_headers()
-        self.wfile.write(response)
+        body = _json_dumps(data, indent=True)
+        self.log_request(200)
+        self.wfile.write(self._JSON_HEADER % len(body) + body)
+
+    def _send_html_response(self, html_content):
+        """Send HTML response (accepts str or already-encoded bytes)."""
+        if isinstance(html_content, bytes):
+            body = html_content
+        else:
+            body = html_content.encode("utf-8")
+        self.log_request(200)
+        self.wfile.write(self._HTML_HEADER % len(body) + body)
 
     def _send_error(self, code: int, message: str):
         """Send error response."""
-        error_response = {"error": message, "code": code}
-        response = json.dumps(error_response).encode("utf-8")
-        self.send_response(code)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Content-Length", str(len(response)))
-        self.send_header("Access-Control-Allow-Origin", "*")
-        self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
-        self.send_header("Access-Control-Allow-Headers", "Content-Type")
-        self.end_headers()
-        self.wfile.write(response)
+        body = _json_dumps({"error": message, "code": code})
+        reason = self.responses.get(code, ("Error",))[0].encode("latin-1")
+        self.log_request(code)
+        self.wfile.write(self._ERROR_HEADER % (code, reason, len(body)) + body)
+
+
+class APIServer(ThreadingHTTPServer):
+    """Threaded HTTP server for the API with SO_REUSEPORT enabled."""
+
+    def server_bind(self):
+        # SO_REUSEPORT lets a restarted server rebind the port immediately
+        # and leaves the door open to running extra listeners on the same
+        # port. We keep a single in-process listener: the handlers work
+        # directly on the bus server's client table and event loop, so
+        # sharding across worker processes would need that state moved out
+        # of process first.
+        if hasattr(socket, "SO_REUSEPORT"):
+            try:
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            except OSError:
+                pass
+        super().server_bind()
 
 
 class BusServerWithAPI(MainServer):
@@ -389,9 +492,10 @@ class BusServerWithAPI(MainServer):
     ):
         super().__init__(port, bind, quiet)
         self.api_port = api_port or (port + 1000) if port > 0 else 9080
-        self.api_server: Optional[HTTPServer] = None
+        self.api_server: Optional[APIServer] = None
         self.api_thread: Optional[threading.Thread] = None
         self._event_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._log_listener: Optional[logging.handlers.QueueListener] = None
 
     async def start(self) -> None:
         """Start the bus server and API server."""
@@ -410,15 +514,32 @@ class BusServerWithAPI(MainServer):
         if not self.quiet:
             print(f"🌐 Starting API server on {self.host}:{self.api_port}")
 
+        self._setup_api_logging()
+
+        # Resolve the template renderer once; creating it per request
+        # re-stats the template directory on disk
+        template_renderer = get_template_renderer()
+
         def handler_factory(*args, **kwargs):
-            return BusAPIHandler(self, *args, **kwargs)
+            return BusAPIHandler(self, template_renderer, *args, **kwargs)
 
         # Use the same host as the main server
-        self.api_server = HTTPServer((self.host, self.api_port), handler_factory)
+        self.api_server = APIServer((self.host, self.api_port), handler_factory)
         self.api_thread = threading.Thread(target=self.api_server.serve_forever)
         self.api_thread.daemon = True
         self.api_thread.start()
 
+    def _setup_api_logging(self) -> None:
+        """Route API request logging through a queue so handlers never block."""
+        _api_logger.setLevel(logging.WARNING if self.quiet else logging.INFO)
+        if not _api_logger.handlers:
+            log_queue: queue.SimpleQueue = queue.SimpleQueue()
+            _api_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+            self._log_listener = logging.handlers.QueueListener(
+                log_queue, logging.StreamHandler()
+            )
+            self._log_listener.start()
+
     def _stop_api_server(self) -> None:
         """Stop the REST API server."""
         if self.api_server:
@@ -427,3 +548,8 @@ class BusServerWithAPI(MainServer):
 
         if self.api_thread and self.api_thread.is_alive():
             self.api_thread.join(timeout=5.0)
+
+        if self._log_listener:
+            self._log_listener.stop()
+            self._log_listener = None
+            _api_logger.handlers.clear()
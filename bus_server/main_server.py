@@ -32,6 +32,9 @@ class MainServer(BaseServer):
         super().__init__(port, bind, quiet)
         self.last_connection_log = time.time()
         self.discord_webhook = self._load_discord_webhook()
+        # Running count of IDENTIFIED clients, maintained on state
+        # transitions so status paths don't rescan self.clients
+        self.identified_count = 0
 
     def _load_discord_webhook(self) -> Optional[str]:
         """Load Discord webhook URL from config.ini"""
@@ -127,6 +130,7 @@ class MainServer(BaseServer):
             )
 
         if client.state == self.IDENTIFIED:
+            self.identified_count -= 1
             await self.broadcast(
                 "LEAVE", {"clientID": client.client_id}, exclude={client.client_id}
             )
@@ -257,6 +261,7 @@ class MainServer(BaseServer):
             client.private_only = args.get("privateOnly", False)
             client.name = f"{client.user_agent}:{client.client_id}"
             client.state = self.IDENTIFIED
+            self.identified_count += 1
 
             if not self.quiet:
                 print(f"✅ Client identified: {client.name}")
@@ -348,9 +353,7 @@ class MainServer(BaseServer):
             await asyncio.sleep(30)  # Log every 30 seconds
             if not self.quiet and time.time() - self.last_connection_log > 30:
                 total_clients = len(self.clients)
-                identified_clients = len(
-                    [c for c in self.clients.values() if c.state == self.IDENTIFIED]
-                )
+                identified_clients = self.identified_count
 
                 if total_clients > 0:
                     print(f"🔗 {identified_clients}/{total_clients} clients connected")
@@ -27,33 +27,79 @@ class TemplateRenderer:
 
         self.template_dir = template_dir
         self.start_time = time.time()
-
-        # Set up Jinja2 environment
+        self.start_time_int = int(self.start_time)
+        # Monotonic start for uptime so wall-clock jumps don't skew it;
+        # the formatted string is cached at one-second resolution
+        self._start_monotonic = time.monotonic()
+        self._uptime_cache = (-1, "")
+
+        # Set up Jinja2 environment. Templates never change at runtime, so
+        # disable auto-reload to skip the filesystem stat on every lookup.
         self.env = Environment(
             loader=FileSystemLoader(template_dir),
             autoescape=select_autoescape(["html", "xml"]),
+            auto_reload=False,
+            cache_size=400,
         )
 
+        # Compiled templates memoized by name, avoiding the environment
+        # lookup on every render
+        self._template_cache: Dict[str, Any] = {}
+
+        # Last encoded render per template, keyed by wall-clock second and
+        # context so static-ish pages skip the render+encode when polled
+        self._rendered_cache: Dict[str, tuple] = {}
+
         # Add custom filters
         self.env.filters["format_uptime"] = self._format_uptime
         self.env.filters["format_datetime"] = self._format_datetime
 
     def render_template(self, template_name: str, **context: Any) -> str:
         """Render a template with the given context."""
-        template = self.env.get_template(template_name)
-
-        # Add common context variables
-        common_context = {
-            "current_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "current_timestamp": int(time.time()),
-            "server_start_time": self.start_time,
-            "uptime_seconds": int(time.time() - self.start_time),
-        }
+        template = self._template_cache.get(template_name)
+        if template is None:
+            template = self._template_cache.setdefault(
+                template_name, self.env.get_template(template_name)
+            )
+
+        # Add common context variables (passed context takes precedence)
+        now = int(time.time())
+        context.setdefault(
+            "current_time", datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        )
+        context.setdefault("current_timestamp", now)
+        context.setdefault("server_start_time", self.start_time)
+        context.setdefault("uptime_seconds", now - self.start_time_int)
 
-        # Merge contexts (passed context overrides common)
-        full_context = {**common_context, **context}
+        return template.render(context)
 
-        return template.render(**full_context)
+    def render_template_bytes(self, template_name: str, **context: Any) -> bytes:
+        """Render a template to UTF-8 bytes, reusing the previous render
+        while the context and wall-clock second are unchanged."""
+        try:
+            key = (int(time.time()), tuple(sorted(context.items())))
+        except TypeError:
+            # Unhashable context value - render without caching
+            return self.render_template(template_name, **context).encode("utf-8")
+
+        cached = self._rendered_cache.get(template_name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        body = self.render_template(template_name, **context).encode("utf-8")
+        self._rendered_cache[template_name] = (key, body)
+        return body
+
+    def get_uptime_str(self) -> str:
+        """Get the formatted server uptime, cached at one-second resolution."""
+        seconds = int(time.monotonic() - self._start_monotonic)
+        cached_seconds, cached_str = self._uptime_cache
+        if seconds == cached_seconds:
+            return cached_str
+
+        uptime_str = self._format_uptime(seconds)
+        self._uptime_cache = (seconds, uptime_str)
+        return uptime_str
 
     def _format_uptime(self, seconds: int) -> str:
         """Format uptime in seconds to a human-readable string."""